@@ -862,30 +862,16 @@ def _create_first_spine_database(db_url):
 def forward_sweep(root, fn):
     """Recursively visit, using `get_children()`, the given sqlalchemy object.
     Apply `fn` on every visited node."""
-    current = root
-    parent = {}
-    children = {current: iter(current.get_children(column_collections=False))}
-    while True:
-        fn(current)
-        # Try and visit next children
-        next_ = next(children[current], None)
-        if next_ is not None:
-            parent[next_] = current
-            children[next_] = iter(next_.get_children(column_collections=False))
-            current = next_
+    fn(root)
+    stack = [iter(root.get_children(column_collections=False))]
+    while stack:
+        next_ = next(stack[-1], None)
+        if next_ is None:
+            # No (more) children, go back to parent
+            stack.pop()
             continue
-        # No (more) children, try and visit next sibling
-        current_parent = parent[current]
-        next_ = next(children[current_parent], None)
-        if next_ is not None:
-            parent[next_] = current_parent
-            children[next_] = iter(next_.get_children(column_collections=False))
-            current = next_
-            continue
-        # No (more) siblings, go back to parent
-        current = current_parent
-        if current == root:
-            break
+        fn(next_)
+        stack.append(iter(next_.get_children(column_collections=False)))
 
 
 def get_relationship_entity_class_items(item, object_class_type):
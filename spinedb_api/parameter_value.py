@@ -32,6 +32,7 @@ numpy.ndarray arrays holding numpy.datetime64 objects.
 from collections.abc import Sequence
 from copy import copy
 from datetime import datetime
+from functools import lru_cache
 import json
 from json.decoder import JSONDecodeError
 from numbers import Number
@@ -41,6 +42,11 @@ from dateutil.relativedelta import relativedelta
 import numpy as np
 from .exception import ParameterValueFormatError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Defaulting to seconds precision in numpy.
 _NUMPY_DATETIME_DTYPE = "datetime64[s]"
 NUMPY_DATETIME64_UNIT = "s"
@@ -50,12 +56,29 @@ _TIME_SERIES_DEFAULT_START = "0001-01-01T00:00:00"
 _TIME_SERIES_DEFAULT_RESOLUTION = "1h"
 # Default unit if resolution is given as a number instead of a string.
 _TIME_SERIES_PLAIN_INDEX_UNIT = "m"
-
-
+# Formats tried with strptime() before falling back to dateutil;
+# fromisoformat() does not accept the 'Z' UTC designator before Python 3.11.
+_DATETIME_FORMATS = ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d %H:%M:%S%z")
+# Splits duration strings into count and unit.
+_DURATION_SPLIT_PATTERN = re.compile("\\s|([a-z]|[A-Z])")
+# Matches the interval key at the beginning of time pattern intervals.
+_TIME_PATTERN_INTERVAL_KEY_PATTERN = re.compile(r"(Y|M|D|WD|h|m|s)")
+# Matches plain numbers as defined by the JSON grammar, as bytes and as str.
+# Integer -0 is excluded because JSON decodes it to 0 while float() gives -0.0.
+_JSON_NUMBER = re.compile(rb"(?!-0\Z)-?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?")
+_JSON_NUMBER_STR = re.compile(_JSON_NUMBER.pattern.decode())
+# Finds integer literals that may not fit in 64 bits, as bytes and as str.
+_LONG_INTEGER = re.compile(rb"[0-9]{19}")
+_LONG_INTEGER_STR = re.compile(_LONG_INTEGER.pattern.decode())
+
+
+@lru_cache(maxsize=512)
 def duration_to_relativedelta(duration):
     """
     Converts a duration to a relativedelta object.
 
+    Results are cached since the same few durations tend to be parsed over and over again.
+
     Args:
         duration (str): a duration specification
 
@@ -63,7 +86,7 @@ def duration_to_relativedelta(duration):
         a relativedelta object corresponding to the given duration
     """
     try:
-        count, abbreviation, full_unit = re.split("\\s|([a-z]|[A-Z])", duration, maxsplit=1)
+        count, abbreviation, full_unit = _DURATION_SPLIT_PATTERN.split(duration, maxsplit=1)
         count = int(count)
     except ValueError:
         raise ParameterValueFormatError(f'Could not parse duration "{duration}"')
@@ -121,6 +144,49 @@ def relativedelta_to_duration(delta):
     return "0h"
 
 
+@lru_cache(maxsize=512)
+def _relativedelta_to_seconds(delta):
+    """
+    Converts a relativedelta to seconds if it has a fixed length.
+
+    Args:
+        delta (relativedelta): the relativedelta to convert
+
+    Returns:
+        int: duration in seconds or None if the length of delta depends on the calendar
+    """
+    seconds = ((24 * delta.days + delta.hours) * 60 + delta.minutes) * 60 + delta.seconds
+    if delta != relativedelta(seconds=seconds):
+        return None
+    return seconds
+
+
+def _parse_json(text):
+    """
+    Parses JSON using orjson if it is available and standard library's json otherwise.
+
+    orjson rejects the NaN and Infinity literals that json writes,
+    so those are parsed with json, too.
+    orjson also silently converts integers beyond 64 bits to floats,
+    so text that may contain such integers goes to json directly.
+
+    Args:
+        text (bytes or str): JSON to parse
+
+    Returns:
+        Any: parsed object
+    """
+    if orjson is not None:
+        long_integer = _LONG_INTEGER_STR if isinstance(text, str) else _LONG_INTEGER
+        if long_integer.search(text) is not None:
+            return json.loads(text)
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 def load_db_value(db_value, value_type=None):
     """
     Loads a database parameter value into a Python object using JSON.
@@ -136,7 +202,7 @@ def load_db_value(db_value, value_type=None):
     if db_value is None:
         return None
     try:
-        parsed = json.loads(db_value)
+        parsed = _parse_json(db_value)
     except JSONDecodeError as err:
         raise ParameterValueFormatError(f"Could not decode the value: {err}") from err
     if isinstance(parsed, dict):
@@ -174,6 +240,13 @@ def from_database(database_value, value_type=None):
     Returns:
         Any: the encoded parameter value
     """
+    if orjson is None and value_type is None and database_value:
+        # Plain numbers are by far the most common values, and float() parses them faster than json.
+        # orjson is as fast as this shortcut, so it is only worth it without orjson.
+        # float() is more permissive than JSON, so the value must match JSON's number grammar first.
+        number_pattern = _JSON_NUMBER_STR if isinstance(database_value, str) else _JSON_NUMBER
+        if number_pattern.fullmatch(database_value) is not None:
+            return float(database_value)
     parsed = load_db_value(database_value, value_type)
     if isinstance(parsed, dict):
         return from_dict(parsed)
@@ -197,7 +270,7 @@ def from_database_to_single_value(database_value, value_type):
     Returns:
         Any: single-value representation
     """
-    if value_type is None or value_type not in ("map", "time_series", "time_pattern", "array"):
+    if value_type is None or value_type not in {"map", "time_series", "time_pattern", "array"}:
         return from_database(database_value, value_type)
     return value_type
 
@@ -250,20 +323,11 @@ def from_dict(value_dict):
         the encoded (relationship) parameter value
     """
     value_type = value_dict["type"]
-    try:
-        if value_type == "date_time":
-            return _datetime_from_database(value_dict["data"])
-        if value_type == "duration":
-            return _duration_from_database(value_dict["data"])
-        if value_type == "map":
-            return _map_from_database(value_dict)
-        if value_type == "time_pattern":
-            return _time_pattern_from_database(value_dict)
-        if value_type == "time_series":
-            return _time_series_from_database(value_dict)
-        if value_type == "array":
-            return _array_from_database(value_dict)
+    converter = _FROM_DICT_CONVERTERS.get(value_type)
+    if converter is None:
         raise ParameterValueFormatError(f'Unknown parameter value type "{value_type}"')
+    try:
+        return converter(value_dict)
     except KeyError as error:
         raise ParameterValueFormatError(f'"{error.args[0]}" is missing in the parameter value description')
 
@@ -320,24 +384,54 @@ def _break_dictionary(data):
             f"expected data to be in dictionary format, instead got '{type(data).__name__}'"
         )
     indexes, values = zip(*data.items())
-    return list(indexes), np.array(values)
+    return list(indexes), np.asarray(values, dtype=np.float64)
+
+
+def _parse_date_time(value):
+    """Parses a datetime string.
 
+    ISO 8601 strings are parsed with the fast datetime.fromisoformat()
+    and a few other common formats with datetime.strptime();
+    everything else falls back to dateutil's parser.
 
-def _datetime_from_database(value):
+    Args:
+        value (str): datetime string
+
+    Returns:
+        datetime: parsed datetime
+
+    Raises:
+        ValueError: raised if value cannot be parsed
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    for format_ in _DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, format_)
+        except ValueError:
+            pass
+    return dateutil.parser.parse(value)
+
+
+def _datetime_from_database(value_dict):
     """Converts a datetime database value into a DateTime object."""
+    value = value_dict["data"]
     try:
-        stamp = dateutil.parser.parse(value)
+        stamp = _parse_date_time(value)
     except ValueError:
         raise ParameterValueFormatError(f'Could not parse datetime from "{value}"')
     return DateTime(stamp)
 
 
-def _duration_from_database(value):
+def _duration_from_database(value_dict):
     """
     Converts a duration database value into a Duration object.
 
     The deprecated 'variable durations' will be converted to Arrays.
     """
+    value = value_dict["data"]
     if isinstance(value, (str, int)):
         # Set default unit to minutes if value is a plain number.
         if not isinstance(value, str):
@@ -346,10 +440,10 @@ def _duration_from_database(value):
         # This type of 'variable duration' is deprecated. We make an Array instead.
         # Set default unit to minutes for plain numbers in value.
         value = [v if isinstance(v, str) else f"{v}m" for v in value]
-        return Array([Duration(v) for v in value])
+        return Array([Duration._from_relativedelta(duration_to_relativedelta(v)) for v in value])
     else:
         raise ParameterValueFormatError("Duration value is of unsupported type")
-    return Duration(value)
+    return Duration._from_relativedelta(duration_to_relativedelta(value))
 
 
 def _time_series_from_database(value_dict):
@@ -399,16 +493,11 @@ def _time_series_from_dictionary(value_dict):
         TimeSeriesVariableResolution: restored time series
     """
     data = value_dict["data"]
-    stamps = list()
-    values = np.empty(len(data))
-    for index, (stamp, series_value) in enumerate(data.items()):
-        try:
-            stamp = np.datetime64(stamp, NUMPY_DATETIME64_UNIT)
-        except ValueError:
-            raise ParameterValueFormatError(f'Could not decode time stamp "{stamp}"')
-        stamps.append(stamp)
-        values[index] = series_value
-    stamps = np.array(stamps)
+    try:
+        stamps = np.array(list(data), dtype=_NUMPY_DATETIME_DTYPE)
+    except ValueError as error:
+        raise ParameterValueFormatError(f"Could not decode time stamps: {error}")
+    values = np.fromiter(data.values(), dtype=np.float64, count=len(data))
     ignore_year, repeat = _variable_resolution_time_series_info_from_index(value_dict)
     return TimeSeriesVariableResolution(stamps, values, ignore_year, repeat, value_dict.get("index_name", ""))
 
@@ -454,10 +543,10 @@ def _time_series_from_single_column(value_dict):
             duration = str(duration) + _TIME_SERIES_PLAIN_INDEX_UNIT
         relativedeltas.append(duration_to_relativedelta(duration))
     try:
-        start = dateutil.parser.parse(start)
+        start = _parse_date_time(start)
     except ValueError:
         raise ParameterValueFormatError(f'Could not decode start value "{start}"')
-    values = np.array(value_dict["data"])
+    values = np.asarray(value_dict["data"], dtype=np.float64)
     return TimeSeriesFixedResolution(
         start, relativedeltas, values, ignore_year, repeat, value_dict.get("index_name", "")
     )
@@ -473,18 +562,15 @@ def _time_series_from_two_columns(value_dict):
         TimeSeriesVariableResolution: restored time series
     """
     data = value_dict["data"]
-    stamps = list()
-    values = np.empty(len(data))
+    stamps = np.empty(len(data), dtype=_NUMPY_DATETIME_DTYPE)
     for index, element in enumerate(data):
         if not isinstance(element, Sequence) or len(element) != 2:
             raise ParameterValueFormatError("Invalid value in time series array")
         try:
-            stamp = np.datetime64(element[0], NUMPY_DATETIME64_UNIT)
+            stamps[index] = np.datetime64(element[0], NUMPY_DATETIME64_UNIT)
         except ValueError:
             raise ParameterValueFormatError(f'Could not decode time stamp "{element[0]}"')
-        stamps.append(stamp)
-        values[index] = element[1]
-    stamps = np.array(stamps)
+    values = np.fromiter((element[1] for element in data), dtype=np.float64, count=len(data))
     ignore_year, repeat = _variable_resolution_time_series_info_from_index(value_dict)
     return TimeSeriesVariableResolution(stamps, values, ignore_year, repeat, value_dict.get("index_name", ""))
 
@@ -538,7 +624,7 @@ def _map_from_database(value_dict):
 
 def _map_index_type_from_database(index_type_in_db):
     """Returns the type corresponding to index_type string."""
-    index_type = {"str": str, "date_time": DateTime, "duration": Duration, "float": float}.get(index_type_in_db, None)
+    index_type = _MAP_INDEX_TYPES.get(index_type_in_db, None)
     if index_type is None:
         raise ParameterValueFormatError(f'Unknown index_type "{index_type_in_db}".')
     return index_type
@@ -608,9 +694,7 @@ def _array_from_database(value_dict):
           Array: Array value
     """
     value_type_id = value_dict.get("value_type", "float")
-    value_type = {"float": float, "str": str, "date_time": DateTime, "duration": Duration, "time_period": str}.get(
-        value_type_id, None
-    )
+    value_type = _ARRAY_VALUE_TYPES.get(value_type_id, None)
     if value_type is None:
         raise ParameterValueFormatError(f'Unsupported value type for Array: "{value_type_id}".')
     try:
@@ -622,7 +706,20 @@ def _array_from_database(value_dict):
         return Array(data, value_type, index_name)
 
 
+# Converters from value dictionaries to Python objects keyed by value type.
+_FROM_DICT_CONVERTERS = {
+    "date_time": _datetime_from_database,
+    "duration": _duration_from_database,
+    "map": _map_from_database,
+    "time_pattern": _time_pattern_from_database,
+    "time_series": _time_series_from_database,
+    "array": _array_from_database,
+}
+
+
 class ListValueRef:
+    __slots__ = ("_list_value_id", "__weakref__")
+
     def __init__(self, list_value_id):
         self._list_value_id = list_value_id
 
@@ -638,6 +735,8 @@ class ListValueRef:
 class DateTime:
     """A single datetime value."""
 
+    __slots__ = ("_value", "__weakref__")
+
     VALUE_TYPE = "single value"
 
     def __init__(self, value=None):
@@ -649,7 +748,7 @@ class DateTime:
             value = datetime(year=2000, month=1, day=1)
         elif isinstance(value, str):
             try:
-                value = dateutil.parser.parse(value)
+                value = _parse_date_time(value)
             except ValueError:
                 raise ParameterValueFormatError(f'Could not parse datetime from "{value}"')
         elif isinstance(value, DateTime):
@@ -689,7 +788,8 @@ class DateTime:
 
     def to_database(self):
         """Returns the database representation of this object as JSON."""
-        return json.dumps(self.to_dict()).encode("UTF8"), self.type_()
+        # ISO formatted datetimes need no escaping so we can skip the JSON encoder.
+        return f'{{"data": "{self.value_to_database_data()}"}}'.encode("UTF8"), self.type_()
 
     @property
     def value(self):
@@ -704,6 +804,8 @@ class Duration:
     Durations are always handled as relativedeltas.
     """
 
+    __slots__ = ("_value", "__weakref__")
+
     VALUE_TYPE = "single value"
 
     def __init__(self, value=None):
@@ -721,6 +823,20 @@ class Duration:
             raise ParameterValueFormatError(f'Could not parse duration from "{value}"')
         self._value = value
 
+    @classmethod
+    def _from_relativedelta(cls, delta):
+        """Creates a Duration from a relativedelta bypassing the type checks in the constructor.
+
+        Args:
+            delta (relativedelta): the time step
+
+        Returns:
+            Duration: new duration
+        """
+        duration = cls.__new__(cls)
+        duration._value = delta
+        return duration
+
     def __eq__(self, other):
         """Returns True if other is equal to this object."""
         if not isinstance(other, Duration):
@@ -747,7 +863,8 @@ class Duration:
 
     def to_database(self):
         """Returns the database representation of the duration as JSON."""
-        return json.dumps(self.to_dict()).encode("UTF8"), self.type_()
+        # Duration strings need no escaping so we can skip the JSON encoder.
+        return f'{{"data": "{self.value_to_database_data()}"}}'.encode("UTF8"), self.type_()
 
     @property
     def value(self):
@@ -796,6 +913,8 @@ class IndexedValue:
         index_name (str): index name
     """
 
+    __slots__ = ("_indexes", "_values", "index_name", "__weakref__")
+
     VALUE_TYPE = NotImplemented
 
     def __init__(self, index_name):
@@ -884,6 +1003,8 @@ class IndexedValue:
 class Array(IndexedValue):
     """A one dimensional array with zero based indexing."""
 
+    __slots__ = ("_value_type",)
+
     VALUE_TYPE = "array"
     DEFAULT_INDEX_NAME = "i"
 
@@ -924,12 +1045,7 @@ class Array(IndexedValue):
 
     def to_dict(self):
         """See base class."""
-        value_type_id = {
-            float: "float",
-            str: "str",  # String could also mean time_period but we don't have any way to distinguish that, yet.
-            DateTime: "date_time",
-            Duration: "duration",
-        }.get(self._value_type)
+        value_type_id = _ARRAY_VALUE_TYPE_IDS.get(self._value_type)
         if value_type_id is None:
             raise ParameterValueFormatError(f"Cannot write unsupported array value type: {self._value_type.__name__}")
         if value_type_id in ("float", "str"):
@@ -954,6 +1070,8 @@ class IndexedNumberArray(IndexedValue):
     The indexes and numbers are stored in numpy.ndarrays.
     """
 
+    __slots__ = ()
+
     def __init__(self, index_name, values):
         """
         Args:
@@ -966,9 +1084,7 @@ class IndexedNumberArray(IndexedValue):
     @IndexedValue.values.setter
     def values(self, values):
         """Sets the values."""
-        if not isinstance(values, np.ndarray) or not values.dtype == np.dtype(float):
-            values = np.array(values, dtype=float)
-        self._values = values
+        self._values = np.asarray(values, dtype=np.float64)
 
     @staticmethod
     def type_():
@@ -982,6 +1098,8 @@ class IndexedNumberArray(IndexedValue):
 class TimeSeries(IndexedNumberArray):
     """An abstract base class for time series."""
 
+    __slots__ = ("_ignore_year", "_repeat")
+
     VALUE_TYPE = "time series"
     DEFAULT_INDEX_NAME = "t"
 
@@ -1046,10 +1164,9 @@ def _check_time_pattern_index(union_str):
     union_dlm = ","
     intersection_dlm = ";"
     range_dlm = "-"
-    regexp = r"(Y|M|D|WD|h|m|s)"
     for intersection_str in union_str.split(union_dlm):
         for interval_str in intersection_str.split(intersection_dlm):
-            m = re.match(regexp, interval_str)
+            m = _TIME_PATTERN_INTERVAL_KEY_PATTERN.match(interval_str)
             if m is None:
                 raise ParameterValueFormatError(
                     f"Invalid interval {interval_str}, it should start with either Y, M, D, WD, h, m, or s."
@@ -1095,6 +1212,8 @@ class _TimePatternIndexes(_Indexes):
 class TimePattern(IndexedNumberArray):
     """Represents a time pattern (relationship) parameter value."""
 
+    __slots__ = ()
+
     VALUE_TYPE = "time pattern"
     DEFAULT_INDEX_NAME = "p"
 
@@ -1133,7 +1252,7 @@ class TimePattern(IndexedNumberArray):
 
     def to_dict(self):
         """Returns the database representation of this time pattern."""
-        value_dict = {"data": dict(zip(self._indexes, self._values))}
+        value_dict = {"data": dict(zip(self._indexes.tolist(), self._values.tolist()))}
         if self.index_name != "p":
             value_dict["index_name"] = self.index_name
         return value_dict
@@ -1149,6 +1268,8 @@ class TimeSeriesFixedResolution(TimeSeries):
     other than having getters for their values.
     """
 
+    __slots__ = ("_start", "_resolution", "_step_seconds")
+
     def __init__(self, start, resolution, values, ignore_year, repeat, index_name=""):
         """
         Args:
@@ -1162,6 +1283,7 @@ class TimeSeriesFixedResolution(TimeSeries):
         super().__init__(values, ignore_year, repeat, index_name)
         self._start = None
         self._resolution = None
+        self._step_seconds = None
         self.start = start
         self.resolution = resolution
 
@@ -1170,31 +1292,25 @@ class TimeSeriesFixedResolution(TimeSeries):
         if not isinstance(other, TimeSeriesFixedResolution):
             return NotImplemented
         return (
-            self._start == other._start
-            and self._resolution == other._resolution
-            and np.array_equal(self._values, other._values, equal_nan=True)
-            and self._ignore_year == other._ignore_year
+            self._ignore_year == other._ignore_year
             and self._repeat == other._repeat
             and self.index_name == other.index_name
+            and self._start == other._start
+            and self._resolution == other._resolution
+            and len(self._values) == len(other._values)
+            and np.array_equal(self._values, other._values, equal_nan=True)
         )
 
     @property
     def indexes(self):
         """Returns the time stamps as a numpy.ndarray of numpy.datetime64 objects."""
         if self._indexes is None:
-            step_index = 0
-            step_cycle_index = 0
-            full_cycle_duration = sum(self._resolution, relativedelta())
-            stamps = np.empty(len(self), dtype=_NUMPY_DATETIME_DTYPE)
-            stamps[0] = self._start
-            for stamp_index in range(1, len(self._values)):
-                if step_index >= len(self._resolution):
-                    step_index = 0
-                    step_cycle_index += 1
-                current_cycle_duration = sum(self._resolution[: step_index + 1], relativedelta())
-                duration_from_start = step_cycle_index * full_cycle_duration + current_cycle_duration
-                stamps[stamp_index] = self._start + duration_from_start
-                step_index += 1
+            if self._step_seconds is not None:
+                start = np.datetime64(self._start, NUMPY_DATETIME64_UNIT)
+                step = np.timedelta64(self._step_seconds, NUMPY_DATETIME64_UNIT)
+                stamps = start + step * np.arange(len(self._values))
+            else:
+                stamps = self._stamps_from_relativedeltas()
             self.indexes = np.array(stamps, dtype=_NUMPY_DATETIME_DTYPE)
         return IndexedValue.indexes.fget(self)
 
@@ -1204,6 +1320,32 @@ class TimeSeriesFixedResolution(TimeSeries):
         # Needed because we redefine the setter
         self._indexes = _Indexes(indexes)
 
+    def _stamps_from_relativedeltas(self):
+        """Generates time stamps by applying resolution steps cyclically using calendar arithmetic.
+
+        Returns:
+            numpy.ndarray: time stamps
+        """
+        step_index = 0
+        step_cycle_index = 0
+        cumulative_durations = list()
+        cycle_duration = relativedelta()
+        for step in self._resolution:
+            cycle_duration = cycle_duration + step
+            cumulative_durations.append(cycle_duration)
+        full_cycle_duration = cumulative_durations[-1]
+        stamps = np.empty(len(self), dtype=_NUMPY_DATETIME_DTYPE)
+        stamps[0] = self._start
+        for stamp_index in range(1, len(self._values)):
+            if step_index >= len(self._resolution):
+                step_index = 0
+                step_cycle_index += 1
+            current_cycle_duration = cumulative_durations[step_index]
+            duration_from_start = step_cycle_index * full_cycle_duration + current_cycle_duration
+            stamps[stamp_index] = self._start + duration_from_start
+            step_index += 1
+        return stamps
+
     @property
     def start(self):
         """Returns the start index."""
@@ -1219,11 +1361,14 @@ class TimeSeriesFixedResolution(TimeSeries):
         """
         if isinstance(start, str):
             try:
-                self._start = dateutil.parser.parse(start)
+                self._start = _parse_date_time(start)
             except ValueError:
                 raise ParameterValueFormatError(f'Cannot parse start time "{start}"')
         elif isinstance(start, np.datetime64):
             self._start = start.tolist()
+            if isinstance(self._start, int):
+                # tolist() gives an int for precisions finer than microseconds.
+                self._start = start.astype("datetime64[us]").tolist()
         else:
             self._start = start
         self._indexes = None
@@ -1246,12 +1391,12 @@ class TimeSeriesFixedResolution(TimeSeries):
         elif not isinstance(resolution, Sequence):
             resolution = [resolution]
         else:
-            for i in range(len(resolution)):
-                if isinstance(resolution[i], str):
-                    resolution[i] = duration_to_relativedelta(resolution[i])
+            resolution = [duration_to_relativedelta(r) if isinstance(r, str) else r for r in resolution]
         if not resolution:
             raise ParameterValueFormatError("Resolution cannot be zero.")
         self._resolution = resolution
+        # Single fixed length steps are cached in seconds for fast index generation.
+        self._step_seconds = _relativedelta_to_seconds(resolution[0]) if len(resolution) == 1 else None
         self._indexes = None
 
     def to_dict(self):
@@ -1277,6 +1422,8 @@ class TimeSeriesFixedResolution(TimeSeries):
 class TimeSeriesVariableResolution(TimeSeries):
     """A class representing time series data with variable time steps."""
 
+    __slots__ = ()
+
     def __init__(self, indexes, values, ignore_year, repeat, index_name=""):
         """
         Args:
@@ -1289,6 +1436,13 @@ class TimeSeriesVariableResolution(TimeSeries):
         super().__init__(values, ignore_year, repeat, index_name)
         if len(indexes) != len(values):
             raise ParameterValueFormatError("Length of values does not match length of indexes")
+        if not isinstance(indexes, np.ndarray) and all(isinstance(index, str) for index in indexes):
+            try:
+                # Let numpy parse all the strings in one go.
+                indexes = np.array(indexes, dtype=_NUMPY_DATETIME_DTYPE)
+            except ValueError:
+                # Convert element by element below to find the offending string.
+                pass
         if not isinstance(indexes, np.ndarray):
             date_times = np.empty(len(indexes), dtype=_NUMPY_DATETIME_DTYPE)
             for i, index in enumerate(indexes):
@@ -1309,17 +1463,18 @@ class TimeSeriesVariableResolution(TimeSeries):
         if not isinstance(other, TimeSeriesVariableResolution):
             return NotImplemented
         return (
-            np.array_equal(self._indexes, other._indexes)
-            and np.array_equal(self._values, other._values, equal_nan=True)
-            and self._ignore_year == other._ignore_year
+            self._ignore_year == other._ignore_year
             and self._repeat == other._repeat
             and self.index_name == other.index_name
+            and len(self._values) == len(other._values)
+            and np.array_equal(self._indexes, other._indexes)
+            and np.array_equal(self._values, other._values, equal_nan=True)
         )
 
     def to_dict(self):
         """Returns the value in its database representation"""
         value_dict = dict()
-        value_dict["data"] = {str(index): float(value) for index, value in zip(self._indexes, self._values)}
+        value_dict["data"] = dict(zip(np.datetime_as_string(self._indexes).tolist(), self._values.tolist()))
         # Add "index" entry only if its contents are not set to their default values.
         if self._ignore_year:
             value_dict.setdefault("index", dict())["ignore_year"] = self._ignore_year
@@ -1333,6 +1488,8 @@ class TimeSeriesVariableResolution(TimeSeries):
 class Map(IndexedValue):
     """A nested general purpose indexed value."""
 
+    __slots__ = ("_index_type",)
+
     VALUE_TYPE = "map"
     DEFAULT_INDEX_NAME = "x"
 
@@ -1366,12 +1523,10 @@ class Map(IndexedValue):
 
     def value_to_database_data(self):
         """Returns map's database representation's 'data' dictionary."""
-        data = list()
-        for index, value in zip(self._indexes, self._values):
-            index_in_db = _map_index_to_database(index)
-            value_in_db = _map_value_to_database(value)
-            data.append([index_in_db, value_in_db])
-        return data
+        return [
+            [_map_index_to_database(index), _map_value_to_database(value)]
+            for index, value in zip(self._indexes, self._values)
+        ]
 
     @staticmethod
     def type_():
@@ -1423,13 +1578,10 @@ def convert_leaf_maps_to_specialized_containers(map_):
     converted_container = _try_convert_to_container(map_)
     if converted_container is not None:
         return converted_container
-    new_values = list()
-    for _, value in zip(map_.indexes, map_.values):
-        if isinstance(value, Map):
-            converted = convert_leaf_maps_to_specialized_containers(value)
-            new_values.append(converted)
-        else:
-            new_values.append(value)
+    new_values = [
+        convert_leaf_maps_to_specialized_containers(value) if isinstance(value, Map) else value
+        for _, value in zip(map_.indexes, map_.values)
+    ]
     return Map(map_.indexes, new_values, index_name=map_.index_name)
 
 
@@ -1448,19 +1600,18 @@ def convert_containers_to_maps(value):
     if isinstance(value, Map):
         if not value:
             return value
-        new_values = list()
-        for _, x in zip(value.indexes, value.values):
-            if isinstance(x, IndexedValue):
-                new_values.append(convert_containers_to_maps(x))
-            else:
-                new_values.append(x)
+        new_values = [
+            convert_containers_to_maps(x) if isinstance(x, IndexedValue) else x
+            for _, x in zip(value.indexes, value.values)
+        ]
         return Map(list(value.indexes), new_values, index_name=value.index_name)
     if isinstance(value, IndexedValue):
         if not value:
             if isinstance(value, TimeSeries):
                 return Map([], [], DateTime, index_name=TimeSeries.DEFAULT_INDEX_NAME)
             return Map([], [], str)
-        return Map(list(value.indexes), list(value.values), index_name=value.index_name)
+        values = value.values.tolist() if isinstance(value, IndexedNumberArray) else list(value.values)
+        return Map(list(value.indexes), values, index_name=value.index_name)
     return value
 
 
@@ -1486,14 +1637,8 @@ def convert_map_to_table(map_, make_square=True, row_this_far=None, empty=None):
         else:
             rows += convert_map_to_table(value, False, row_this_far + [index])
     if make_square:
-        max_length = 0
-        for row in rows:
-            max_length = max(max_length, len(row))
-        equal_length_rows = list()
-        for row in rows:
-            equal_length_row = row + (max_length - len(row)) * [empty]
-            equal_length_rows.append(equal_length_row)
-        return equal_length_rows
+        max_length = max((len(row) for row in rows), default=0)
+        return [row + (max_length - len(row)) * [empty] for row in rows]
     return rows
 
 
@@ -1540,6 +1685,16 @@ def _try_convert_to_container(map_):
 # List of scalar types that are supported by the spinedb_api
 SUPPORTED_TYPES = (Duration, DateTime, float, str)
 
+# Lookup tables between type identifiers in the database and Python types.
+_MAP_INDEX_TYPES = {"str": str, "date_time": DateTime, "duration": Duration, "float": float}
+_ARRAY_VALUE_TYPES = {"float": float, "str": str, "date_time": DateTime, "duration": Duration, "time_period": str}
+_ARRAY_VALUE_TYPE_IDS = {
+    float: "float",
+    str: "str",  # String could also mean time_period but we don't have any way to distinguish that, yet.
+    DateTime: "date_time",
+    Duration: "duration",
+}
+
 
 def join_value_and_type(db_value, db_type):
     """Joins database value and type into a string.
@@ -1573,7 +1728,7 @@ def split_value_and_type(value_and_type):
         str or NoneType
     """
     try:
-        parsed = json.loads(value_and_type)
+        parsed = _parse_json(value_and_type)
     except (TypeError, json.JSONDecodeError):
         parsed = value_and_type
     return dump_db_value(parsed)
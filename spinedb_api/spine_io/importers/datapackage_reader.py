@@ -15,6 +15,7 @@ Contains DataPackageConnector class.
 :author: M. Marin (KTH)
 :date:   15.11.2020
 """
+import copyreg
 import threading
 from itertools import chain
 
@@ -33,6 +34,8 @@ class DataPackageConnector(SourceConnection):
 
     FILE_EXTENSIONS = "*.json"
 
+    __slots__ = ("_filename", "_datapackage", "_resource_name_lock")
+
     def __init__(self, settings):
         super().__init__(settings)
         self._filename = None
@@ -43,19 +46,17 @@ class DataPackageConnector(SourceConnection):
         """Builds a state that can be pickled.
 
         Returns:
-            dict: picklable representation of the connector
+            tuple: picklable representation of the connector
         """
-        state = self.__dict__.copy()
-        del state["_resource_name_lock"]
-        return state
+        return self._filename, self._datapackage
 
     def __setstate__(self, state):
         """Restores connector from pickled state.
 
         Args:
-            state (dict): pickled state
+            state (tuple): pickled state
         """
-        self.__dict__.update(state)
+        self._filename, self._datapackage = state
         self._resource_name_lock = threading.Lock()
 
     def connect_to_source(self, source):
@@ -112,3 +113,37 @@ class DataPackageConnector(SourceConnection):
                 return chain([resource.headers], iterator), None
         # table not found
         return iter([]), []
+
+
+def _reconstruct_connector(state):
+    """Creates a connector from pickled state.
+
+    Args:
+        state (tuple): state returned by :meth:`DataPackageConnector.__getstate__`
+
+    Returns:
+        DataPackageConnector: unpickled connector
+    """
+    connector = DataPackageConnector.__new__(DataPackageConnector)
+    connector.__setstate__(state)
+    return connector
+
+
+def _reduce_connector(connector):
+    """Reduces connector for pickling.
+
+    Args:
+        connector (DataPackageConnector): connector to pickle
+
+    Returns:
+        tuple: reconstructor function and its arguments
+    """
+    if connector._filename is None and connector._datapackage is None:
+        return _UNCONNECTED_REDUCTION
+    return _reconstruct_connector, (connector.__getstate__(),)
+
+
+# Unconnected connectors all reduce to the same thing so we build it only once.
+_UNCONNECTED_REDUCTION = (_reconstruct_connector, ((None, None),))
+# Registering the reducer lets the pickler skip the generic __reduce_ex__ machinery.
+copyreg.pickle(DataPackageConnector, _reduce_connector)
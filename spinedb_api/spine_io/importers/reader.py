@@ -48,6 +48,9 @@ class SourceConnection:
     # File extensions for modal widget that that returns action (OK, CANCEL) and source object
     FILE_EXTENSIONS = NotImplemented
 
+    # Empty so subclasses that declare their own slots do not get an instance dict.
+    __slots__ = ()
+
     def __init__(self, settings):
         """
         Args:
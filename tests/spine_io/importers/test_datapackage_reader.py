@@ -17,9 +17,12 @@ Contains unit tests for DatapackageConnector.
 """
 from contextlib import contextmanager
 import csv
+from io import BytesIO
+import marshal
 import unittest
 from pathlib import Path
 import pickle
+import pickletools
 from tempfile import TemporaryDirectory
 from datapackage import Package
 from spinedb_api.spine_io.importers.datapackage_reader import DataPackageConnector
@@ -28,8 +31,34 @@ from spinedb_api.spine_io.importers.datapackage_reader import DataPackageConnect
 class TestDatapackageConnector(unittest.TestCase):
     def test_connector_is_picklable(self):
         reader = DataPackageConnector(None)
-        pickled = pickle.dumps(reader)
-        self.assertTrue(pickled)
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                pickled = BytesIO()
+                pickle.Pickler(pickled, protocol=protocol).dump(reader)
+                self.assertLess(pickled.tell(), 128)
+                pickled.seek(0)
+                globals_in_pickle = [
+                    opcode for opcode, _, _ in pickletools.genops(pickled) if opcode.name in ("GLOBAL", "STACK_GLOBAL")
+                ]
+                self.assertEqual(len(globals_in_pickle), 1)
+                pickled.seek(0)
+                unpickled = pickle.Unpickler(pickled).load()
+                self.assertIsInstance(unpickled, DataPackageConnector)
+                for attribute in DataPackageConnector.__slots__:
+                    if attribute == "_resource_name_lock":
+                        self.assertIsNot(unpickled._resource_name_lock, reader._resource_name_lock)
+                        continue
+                    self.assertEqual(getattr(unpickled, attribute), getattr(reader, attribute))
+
+    def test_unconnected_connectors_pickle_identically(self):
+        self.assertEqual(pickle.dumps(DataPackageConnector(None)), pickle.dumps(DataPackageConnector(None)))
+
+    def test_unconnected_connector_state_consists_of_primitives(self):
+        reader = DataPackageConnector(None)
+        try:
+            marshal.dumps(reader.__getstate__())
+        except ValueError:
+            self.fail("unconnected connector's state contains non-primitive objects")
 
     def test_header_on(self):
         data = [["a", "b"], ["1.1", "2.2"]]
@@ -18,7 +18,8 @@ Unit tests for helpers.py.
 
 
 import unittest
-from spinedb_api.helpers import compare_schemas, create_new_spine_database
+from sqlalchemy import Column, Integer, MetaData, Table, select
+from spinedb_api.helpers import compare_schemas, create_new_spine_database, forward_sweep
 
 
 class TestHelpers(unittest.TestCase):
@@ -41,6 +42,27 @@ class TestHelpers(unittest.TestCase):
         engine2.execute("drop table entity_type")
         self.assertFalse(compare_schemas(engine1, engine2))
 
+    def test_forward_sweep_visits_all_tables_in_query(self):
+        metadata = MetaData()
+        table1 = Table("table1", metadata, Column("id", Integer, primary_key=True))
+        table2 = Table("table2", metadata, Column("id", Integer, primary_key=True))
+        query = select([table1.c.id]).where(table1.c.id == select([table2.c.id]).as_scalar()).alias()
+        tables = set()
+
+        def collect_tables(node):
+            if isinstance(node, Table):
+                tables.add(node.name)
+
+        forward_sweep(query, collect_tables)
+        self.assertEqual(tables, {"table1", "table2"})
+
+    def test_forward_sweep_visits_root_without_children(self):
+        metadata = MetaData()
+        table = Table("table", metadata, Column("id", Integer, primary_key=True))
+        visited = []
+        forward_sweep(table, visited.append)
+        self.assertEqual(visited, [table])
+
 
 if __name__ == "__main__":
     unittest.main()
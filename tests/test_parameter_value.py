@@ -16,13 +16,15 @@ Tests for the parameter_value module.
 :date:   7.6.2019
 """
 
-from datetime import datetime
+import copy
+from datetime import date, datetime, timezone
 import json
+import math
 import unittest
-import dateutil.parser
+import weakref
 from dateutil.relativedelta import relativedelta
-import numpy as np
-import numpy.testing
+import numpy
+from spinedb_api.exception import ParameterValueFormatError
 from spinedb_api.parameter_value import (
     convert_containers_to_maps,
     convert_leaf_maps_to_specialized_containers,
@@ -30,11 +32,15 @@ from spinedb_api.parameter_value import (
     duration_to_relativedelta,
     relativedelta_to_duration,
     from_database,
+    from_dict,
+    load_db_value,
+    split_value_and_type,
     to_database,
     Array,
     DateTime,
     Duration,
     IndexedNumberArray,
+    ListValueRef,
     Map,
     TimePattern,
     TimeSeriesFixedResolution,
@@ -42,106 +48,65 @@ from spinedb_api.parameter_value import (
     TimeSeries,
 )
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+ONE_HOUR = relativedelta(hours=1)
+ONE_DAY = relativedelta(days=1)
+ONE_MONTH = relativedelta(months=1)
+HALF_AN_HOUR = relativedelta(minutes=30)
+
 
 class TestParameterValue(unittest.TestCase):
     """Test for the free functions and classes in parameter_value."""
 
-    def test_duration_to_relativedelta_seconds(self):
-        delta = duration_to_relativedelta("7s")
-        self.assertEqual(delta, relativedelta(seconds=7))
-        delta = duration_to_relativedelta("1 second")
-        self.assertEqual(delta, relativedelta(seconds=1))
-        delta = duration_to_relativedelta("7 seconds")
-        self.assertEqual(delta, relativedelta(seconds=7))
-        delta = duration_to_relativedelta("99 seconds")
-        self.assertEqual(delta, relativedelta(minutes=1, seconds=39))
-
-    def test_relativedelta_to_duration_seconds(self):
-        delta = duration_to_relativedelta("7s")
-        duration = relativedelta_to_duration(delta)
-        self.assertEqual(duration, "7s")
-        delta = duration_to_relativedelta("9999999s")
-        duration = relativedelta_to_duration(delta)
-        self.assertEqual(duration, "9999999s")
-
-    def test_duration_to_relativedelta_minutes(self):
-        delta = duration_to_relativedelta("7m")
-        self.assertEqual(delta, relativedelta(minutes=7))
-        delta = duration_to_relativedelta("1 minute")
-        self.assertEqual(delta, relativedelta(minutes=1))
-        delta = duration_to_relativedelta("7 minutes")
-        self.assertEqual(delta, relativedelta(minutes=7))
-
-    def test_relativedelta_to_duration_minutes(self):
-        delta = duration_to_relativedelta("7m")
-        duration = relativedelta_to_duration(delta)
-        self.assertEqual(duration, "7m")
-        delta = duration_to_relativedelta("999999m")
-        duration = relativedelta_to_duration(delta)
-        self.assertEqual(duration, "999999m")
-
-    def test_duration_to_relativedelta_hours(self):
-        delta = duration_to_relativedelta("7h")
-        self.assertEqual(delta, relativedelta(hours=7))
-        delta = duration_to_relativedelta("1 hour")
-        self.assertEqual(delta, relativedelta(hours=1))
-        delta = duration_to_relativedelta("7 hours")
-        self.assertEqual(delta, relativedelta(hours=7))
-
-    def test_relativedelta_to_duration_hours(self):
-        delta = duration_to_relativedelta("7h")
-        duration = relativedelta_to_duration(delta)
-        self.assertEqual(duration, "7h")
-        delta = duration_to_relativedelta("99999h")
-        duration = relativedelta_to_duration(delta)
-        self.assertEqual(duration, "99999h")
-
-    def test_duration_to_relativedelta_days(self):
-        delta = duration_to_relativedelta("7D")
-        self.assertEqual(delta, relativedelta(days=7))
-        delta = duration_to_relativedelta("1 day")
-        self.assertEqual(delta, relativedelta(days=1))
-        delta = duration_to_relativedelta("7 days")
-        self.assertEqual(delta, relativedelta(days=7))
-
-    def test_relativedelta_to_duration_days(self):
-        delta = duration_to_relativedelta("7D")
-        duration = relativedelta_to_duration(delta)
-        self.assertEqual(duration, "7D")
-        delta = duration_to_relativedelta("9999D")
-        duration = relativedelta_to_duration(delta)
-        self.assertEqual(duration, "9999D")
-
-    def test_duration_to_relativedelta_months(self):
-        delta = duration_to_relativedelta("7M")
-        self.assertEqual(delta, relativedelta(months=7))
-        delta = duration_to_relativedelta("1 month")
-        self.assertEqual(delta, relativedelta(months=1))
-        delta = duration_to_relativedelta("7 months")
-        self.assertEqual(delta, relativedelta(months=7))
-
-    def test_relativedelta_to_duration_months(self):
-        delta = duration_to_relativedelta("7M")
-        duration = relativedelta_to_duration(delta)
-        self.assertEqual(duration, "7M")
-        delta = duration_to_relativedelta("99M")
-        duration = relativedelta_to_duration(delta)
-        self.assertEqual(duration, "99M")
-
-    def test_duration_to_relativedelta_years(self):
-        delta = duration_to_relativedelta("7Y")
-        self.assertEqual(delta, relativedelta(years=7))
-        delta = duration_to_relativedelta("7Y")
-        self.assertEqual(delta, relativedelta(years=7))
-        delta = duration_to_relativedelta("1 year")
-        self.assertEqual(delta, relativedelta(years=1))
-        delta = duration_to_relativedelta("7 years")
-        self.assertEqual(delta, relativedelta(years=7))
-
-    def test_relativedelta_to_duration_years(self):
-        delta = duration_to_relativedelta("7Y")
-        duration = relativedelta_to_duration(delta)
-        self.assertEqual(duration, "7Y")
+    @classmethod
+    def setUpClass(cls):
+        cls.RELEASE_DATES = numpy.array(["1977-05-25", "1980-05-21", "1983-05-25"], dtype="datetime64[D]")
+        cls.EXPECTED_EPISODES = [4.0, 5.0, 6.0]
+        cls.RELEASES_AS_DICTIONARY = b'{"data": {"1977-05-25": 4, "1980-05-21": 5, "1983-05-25": 6}}'
+        cls.RELEASES_AS_TWO_COLUMN_ARRAY = b'{"data": [["1977-05-25", 4], ["1980-05-21", 5], ["1983-05-25", 6]]}'
+        cls.SEQUEL_DATES = numpy.array(["1999-05-19", "2002-05-16", "2005-05-19"], dtype="datetime64[D]")
+        cls.SEQUEL_EPISODES = numpy.array([1, 2, 3], dtype=float)
+        cls.TIME_PATTERN_INDEXES = ["M1-4,M9-12", "M5-8"]
+        cls.TIME_PATTERN_VALUES = numpy.array([300.0, 221.5])
+        # Shared arrays must not leak changes between tests, whatever order or process they run in.
+        for fixture in (cls.RELEASE_DATES, cls.SEQUEL_DATES, cls.SEQUEL_EPISODES, cls.TIME_PATTERN_VALUES):
+            fixture.setflags(write=False)
+
+    def test_duration_to_relativedelta(self):
+        cases = (
+            ("7s", relativedelta(seconds=7)),
+            ("1 second", relativedelta(seconds=1)),
+            ("7 seconds", relativedelta(seconds=7)),
+            ("99 seconds", relativedelta(minutes=1, seconds=39)),
+            ("7m", relativedelta(minutes=7)),
+            ("1 minute", relativedelta(minutes=1)),
+            ("7 minutes", relativedelta(minutes=7)),
+            ("7h", relativedelta(hours=7)),
+            ("1 hour", ONE_HOUR),
+            ("7 hours", relativedelta(hours=7)),
+            ("7D", relativedelta(days=7)),
+            ("1 day", ONE_DAY),
+            ("7 days", relativedelta(days=7)),
+            ("7M", relativedelta(months=7)),
+            ("1 month", ONE_MONTH),
+            ("7 months", relativedelta(months=7)),
+            ("7Y", relativedelta(years=7)),
+            ("1 year", relativedelta(years=1)),
+            ("7 years", relativedelta(years=7)),
+        )
+        for duration, expected in cases:
+            with self.subTest(duration=duration):
+                self.assertEqual(duration_to_relativedelta(duration), expected)
+
+    def test_relativedelta_to_duration(self):
+        for duration in ("7s", "9999999s", "7m", "999999m", "7h", "99999h", "7D", "9999D", "7M", "99M", "7Y"):
+            with self.subTest(duration=duration):
+                delta = duration_to_relativedelta(duration)
+                self.assertEqual(relativedelta_to_duration(delta), duration)
 
     def test_from_database_plain_number(self):
         database_value = b"23.0"
@@ -149,35 +114,83 @@ class TestParameterValue(unittest.TestCase):
         self.assertTrue(isinstance(value, float))
         self.assertEqual(value, 23.0)
 
+    def test_from_database_plain_integer_gives_float(self):
+        value = from_database(b"23", value_type=None)
+        self.assertTrue(isinstance(value, float))
+        self.assertEqual(value, 23.0)
+
+    def test_from_database_non_json_numbers_raise(self):
+        for database_value in (b"inf", b"nan", b"1_000", "\u0663"):
+            with self.subTest(database_value=database_value):
+                with self.assertRaises(ParameterValueFormatError):
+                    from_database(database_value, value_type=None)
+
+    def test_from_database_negative_zero_integer_gives_positive_zero(self):
+        value = from_database(b"-0", value_type=None)
+        self.assertEqual(math.copysign(1.0, value), 1.0)
+
+    def test_from_database_plain_number_as_str(self):
+        value = from_database("-2.5e3", value_type=None)
+        self.assertTrue(isinstance(value, float))
+        self.assertEqual(value, -2500.0)
+
+    def test_load_db_value_keeps_integers_beyond_64_bits(self):
+        self.assertEqual(load_db_value(b"123456789012345678901234567890"), 123456789012345678901234567890)
+        self.assertEqual(load_db_value(b"-9999999999999999999"), -9999999999999999999)
+
+    def test_split_value_and_type_keeps_integers_beyond_64_bits(self):
+        db_value, value_type = split_value_and_type("123456789012345678901234567890")
+        self.assertEqual(db_value, b"123456789012345678901234567890")
+        self.assertIsNone(value_type)
+        db_value, value_type = split_value_and_type(
+            '{"type": "array", "value_type": "str", "data": [18446744073709551616]}'
+        )
+        self.assertEqual(db_value, b'{"value_type": "str", "data": [18446744073709551616]}')
+        self.assertEqual(value_type, "array")
+
+    def test_from_database_plain_string(self):
+        value = from_database(b'"23.0"', value_type=None)
+        self.assertEqual(value, "23.0")
+
     def test_from_database_boolean(self):
         database_value = b"true"
         value = from_database(database_value, value_type=None)
         self.assertTrue(isinstance(value, bool))
         self.assertEqual(value, True)
 
+    def test_from_database_plain_nan(self):
+        database_value, value_type = to_database(float("nan"))
+        value = from_database(database_value, value_type)
+        self.assertTrue(isinstance(value, float))
+        self.assertTrue(numpy.isnan(value))
+
+    def test_from_database_unknown_type_raises(self):
+        with self.assertRaises(ParameterValueFormatError):
+            from_database(b'{"data": 2.3}', value_type="unknown_type")
+
     def test_to_database_plain_number(self):
         value = 23.0
         database_value, value_type = to_database(value)
-        value_as_float = json.loads(database_value)
+        value_as_float = _loads(database_value)
         self.assertEqual(value_as_float, value)
         self.assertIsNone(value_type)
 
     def test_to_database_DateTime(self):
-        value = DateTime(datetime(year=2019, month=6, day=26, hour=12, minute=50, second=13))
+        value = DateTime(datetime(2019, 6, 26, 12, 50, 13))
         database_value, value_type = to_database(value)
-        value_as_dict = json.loads(database_value)
+        value_as_dict = _loads(database_value)
         self.assertEqual(value_as_dict, {"data": "2019-06-26T12:50:13"})
         self.assertEqual(value_type, "date_time")
 
     def test_from_database_DateTime(self):
         database_value = b'{"data": "2019-06-01T22:15:00+01:00"}'
         value = from_database(database_value, value_type="date_time")
-        self.assertEqual(value.value, dateutil.parser.parse("2019-06-01T22:15:00+01:00"))
+        self.assertEqual(value.value, datetime.fromisoformat("2019-06-01T22:15:00+01:00"))
 
     def test_DateTime_to_database(self):
-        value = DateTime(datetime(year=2019, month=6, day=26, hour=10, minute=50, second=34))
+        value = DateTime(datetime(2019, 6, 26, 10, 50, 34))
         database_value, value_type = value.to_database()
-        value_dict = json.loads(database_value)
+        value_dict = _loads(database_value)
         self.assertEqual(value_dict, {"data": "2019-06-26T10:50:34"})
         self.assertEqual(value_type, "date_time")
 
@@ -197,13 +210,23 @@ class TestParameterValue(unittest.TestCase):
         expected = Array([Duration("1h"), Duration("1h"), Duration("1h"), Duration("2h")])
         self.assertEqual(value, expected)
 
+    def test_from_database_empty_legacy_Duration_list_gives_float_Array(self):
+        value = from_database(b'{"data": []}', value_type="duration")
+        self.assertEqual(value, Array([]))
+        self.assertEqual(value.value_type, float)
+
     def test_Duration_to_database(self):
         value = Duration(duration_to_relativedelta("8 years"))
         database_value, value_type = value.to_database()
-        value_as_dict = json.loads(database_value)
+        value_as_dict = _loads(database_value)
         self.assertEqual(value_as_dict, {"data": "8Y"})
         self.assertEqual(value_type, "duration")
 
+    def test_single_value_to_database_matches_json_encoder(self):
+        for value in (DateTime("2019-06-01T22:15:00+01:00"), Duration("8 years")):
+            database_value, _ = value.to_database()
+            self.assertEqual(database_value, json.dumps(value.to_dict()).encode("UTF8"))
+
     def test_from_database_TimePattern(self):
         database_value = b"""
         {
@@ -216,7 +239,7 @@ class TestParameterValue(unittest.TestCase):
         value = from_database(database_value, value_type="time_pattern")
         self.assertEqual(len(value), 2)
         self.assertEqual(value.indexes, ["m1-4,m9-12", "m5-8"])
-        numpy.testing.assert_equal(value.values, numpy.array([300.0, 221.5]))
+        self.assertEqual(value.values.tolist(), self.TIME_PATTERN_VALUES.tolist())
         self.assertEqual(value.index_name, "p")
 
     def test_from_database_TimePattern_with_index_name(self):
@@ -230,30 +253,28 @@ class TestParameterValue(unittest.TestCase):
         """
         value = from_database(database_value, value_type="time_pattern")
         self.assertEqual(value.indexes, ["M1-12"])
-        numpy.testing.assert_equal(value.values, numpy.array([300.0]))
+        self.assertEqual(value.values.tolist(), [300.0])
         self.assertEqual(value.index_name, "index")
 
     def test_TimePattern_to_database(self):
-        value = TimePattern(["M1-4,M9-12", "M5-8"], numpy.array([300.0, 221.5]))
+        value = TimePattern(self.TIME_PATTERN_INDEXES, self.TIME_PATTERN_VALUES)
         database_value, value_type = value.to_database()
-        value_as_dict = json.loads(database_value)
+        value_as_dict = _loads(database_value)
         self.assertEqual(value_as_dict, {"data": {"M1-4,M9-12": 300.0, "M5-8": 221.5}})
         self.assertEqual(value_type, "time_pattern")
 
-    def test_TimePattern_to_database_with_integer_values(self):
+    def test_TimePattern_to_dict_with_integer_values(self):
         value = TimePattern(["M1-4,M9-12", "M5-8"], [300, 221])
-        database_value, value_type = value.to_database()
-        value_as_dict = json.loads(database_value)
+        value_as_dict = value.to_dict()
         self.assertEqual(value_as_dict, {"data": {"M1-4,M9-12": 300.0, "M5-8": 221.0}})
-        self.assertEqual(value_type, "time_pattern")
+        self.assertEqual(value.type_(), "time_pattern")
 
-    def test_TimePattern_to_database_with_index_name(self):
+    def test_TimePattern_to_dict_with_index_name(self):
         value = TimePattern(["M1-12"], [300.0])
         value.index_name = "index"
-        database_value, value_type = value.to_database()
-        value_as_dict = json.loads(database_value)
+        value_as_dict = value.to_dict()
         self.assertEqual(value_as_dict, {"index_name": "index", "data": {"M1-12": 300.0}})
-        self.assertEqual(value_type, "time_pattern")
+        self.assertEqual(value.type_(), "time_pattern")
 
     def test_TimePattern_index_length_is_not_limited(self):
         value = TimePattern(["M1-4", "M5-12"], [300, 221])
@@ -262,24 +283,11 @@ class TestParameterValue(unittest.TestCase):
         self.assertEqual(list(value.indexes), ["M1-2,M3-4,M5-6,M7-8,M9-10,M11-12", "M2-3,M4-5,M6-7,M8-9,M10-11"])
 
     def test_from_database_TimeSeriesVariableResolution_as_dictionary(self):
-        releases = b"""{
-                          "data": {
-                              "1977-05-25": 4,
-                              "1980-05-21": 5,
-                              "1983-05-25": 6
-                          }
-                      }"""
-        time_series = from_database(releases, value_type="time_series")
-        self.assertEqual(
-            time_series.indexes,
-            numpy.array(
-                [numpy.datetime64("1977-05-25"), numpy.datetime64("1980-05-21"), numpy.datetime64("1983-05-25")],
-                dtype="datetime64[D]",
-            ),
-        )
+        time_series = from_database(self.RELEASES_AS_DICTIONARY, value_type="time_series")
+        self.assertEqual(time_series.indexes, self.RELEASE_DATES)
         self.assertEqual(len(time_series), 3)
         self.assertTrue(isinstance(time_series.values, numpy.ndarray))
-        numpy.testing.assert_equal(time_series.values, numpy.array([4, 5, 6]))
+        self.assertEqual(time_series.values.tolist(), self.EXPECTED_EPISODES)
         self.assertEqual(time_series.index_name, "t")
 
     def test_from_database_TimeSeriesVariableResolution_as_dictionary_with_index_name(self):
@@ -293,25 +301,17 @@ class TestParameterValue(unittest.TestCase):
         time_series = from_database(releases, value_type="time_series")
         self.assertEqual(time_series.index_name, "index")
 
+    def test_from_database_TimeSeriesVariableResolution_as_dictionary_with_invalid_stamp_raises(self):
+        database_value = b'{"data": {"1977-05-25": 4, "not a date": 5}}'
+        with self.assertRaises(ParameterValueFormatError):
+            from_database(database_value, value_type="time_series")
+
     def test_from_database_TimeSeriesVariableResolution_as_two_column_array(self):
-        releases = b"""{
-                          "data": [
-                              ["1977-05-25", 4],
-                              ["1980-05-21", 5],
-                              ["1983-05-25", 6]
-                          ]
-                      }"""
-        time_series = from_database(releases, value_type="time_series")
-        self.assertEqual(
-            time_series.indexes,
-            numpy.array(
-                [numpy.datetime64("1977-05-25"), numpy.datetime64("1980-05-21"), numpy.datetime64("1983-05-25")],
-                dtype="datetime64[D]",
-            ),
-        )
+        time_series = from_database(self.RELEASES_AS_TWO_COLUMN_ARRAY, value_type="time_series")
+        self.assertEqual(time_series.indexes, self.RELEASE_DATES)
         self.assertEqual(len(time_series), 3)
         self.assertTrue(isinstance(time_series.values, numpy.ndarray))
-        numpy.testing.assert_equal(time_series.values, numpy.array([4, 5, 6]))
+        self.assertEqual(time_series.values.tolist(), self.EXPECTED_EPISODES)
         self.assertEqual(time_series.index_name, "t")
 
     def test_from_database_TimeSeriesVariableResolution_as_two_column_array_with_index_name(self):
@@ -338,29 +338,23 @@ class TestParameterValue(unittest.TestCase):
         self.assertFalse(time_series.repeat)
 
     def test_TimeSeriesVariableResolution_to_database(self):
-        dates = numpy.array(["1999-05-19", "2002-05-16", "2005-05-19"], dtype="datetime64[D]")
-        episodes = numpy.array([1, 2, 3], dtype=float)
-        value = TimeSeriesVariableResolution(dates, episodes, False, False)
+        value = TimeSeriesVariableResolution(self.SEQUEL_DATES, self.SEQUEL_EPISODES, False, False)
         db_value, value_type = value.to_database()
-        releases = json.loads(db_value)
+        releases = _loads(db_value)
         self.assertEqual(releases, {"data": {"1999-05-19": 1, "2002-05-16": 2, "2005-05-19": 3}})
         self.assertEqual(value_type, "time_series")
 
-    def test_TimeSeriesVariableResolution_to_database_with_index_name(self):
+    def test_TimeSeriesVariableResolution_to_dict_with_index_name(self):
         dates = numpy.array(["2002-05-16", "2005-05-19"], dtype="datetime64[D]")
         episodes = numpy.array([1, 2], dtype=float)
         value = TimeSeriesVariableResolution(dates, episodes, False, False, "index")
-        db_value, value_type = value.to_database()
-        releases = json.loads(db_value)
+        releases = value.to_dict()
         self.assertEqual(releases, {"index_name": "index", "data": {"2002-05-16": 1, "2005-05-19": 2}})
-        self.assertEqual(value_type, "time_series")
+        self.assertEqual(value.type_(), "time_series")
 
-    def test_TimeSeriesVariableResolution_to_database_with_ignore_year_and_repeat(self):
-        dates = numpy.array(["1999-05-19", "2002-05-16", "2005-05-19"], dtype="datetime64[D]")
-        episodes = numpy.array([1, 2, 3], dtype=float)
-        value = TimeSeriesVariableResolution(dates, episodes, True, True)
-        db_value, value_type = value.to_database()
-        releases = json.loads(db_value)
+    def test_TimeSeriesVariableResolution_to_dict_with_ignore_year_and_repeat(self):
+        value = TimeSeriesVariableResolution(self.SEQUEL_DATES, self.SEQUEL_EPISODES, True, True)
+        releases = value.to_dict()
         self.assertEqual(
             releases,
             {
@@ -368,7 +362,7 @@ class TestParameterValue(unittest.TestCase):
                 "index": {"ignore_year": True, "repeat": True},
             },
         )
-        self.assertEqual(value_type, "time_series")
+        self.assertEqual(value.type_(), "time_series")
 
     def test_from_database_TimeSeriesFixedResolution(self):
         days_of_our_lives = b"""{
@@ -390,10 +384,10 @@ class TestParameterValue(unittest.TestCase):
             ),
         )
         self.assertTrue(isinstance(time_series.values, numpy.ndarray))
-        numpy.testing.assert_equal(time_series.values, numpy.array([7.0, 5.0, 8.1]))
-        self.assertEqual(time_series.start, dateutil.parser.parse("2019-03-23"))
+        self.assertEqual(time_series.values.tolist(), [7.0, 5.0, 8.1])
+        self.assertEqual(time_series.start, datetime.fromisoformat("2019-03-23"))
         self.assertEqual(len(time_series.resolution), 1)
-        self.assertEqual(time_series.resolution[0], relativedelta(days=1))
+        self.assertEqual(time_series.resolution[0], ONE_DAY)
         self.assertFalse(time_series.ignore_year)
         self.assertFalse(time_series.repeat)
         self.assertEqual(time_series.index_name, "t")
@@ -419,10 +413,10 @@ class TestParameterValue(unittest.TestCase):
                 dtype="datetime64[s]",
             ),
         )
-        numpy.testing.assert_equal(time_series.values, numpy.array([1.0, 2.0, 3.0, 4.0, 5.0, 8.0]))
-        self.assertEqual(time_series.start, dateutil.parser.parse("0001-01-01T00:00:00"))
+        self.assertEqual(time_series.values.tolist(), [1.0, 2.0, 3.0, 4.0, 5.0, 8.0])
+        self.assertEqual(time_series.start, datetime.fromisoformat("0001-01-01T00:00:00"))
         self.assertEqual(len(time_series.resolution), 1)
-        self.assertEqual(time_series.resolution[0], relativedelta(hours=1))
+        self.assertEqual(time_series.resolution[0], ONE_HOUR)
         self.assertTrue(time_series.ignore_year)
         self.assertTrue(time_series.repeat)
 
@@ -459,13 +453,30 @@ class TestParameterValue(unittest.TestCase):
                 dtype="datetime64[s]",
             ),
         )
-        numpy.testing.assert_equal(time_series.values, numpy.array([7.0, 5.0, 8.1, -4.1]))
-        self.assertEqual(time_series.start, dateutil.parser.parse("2019-01-31"))
+        self.assertEqual(time_series.values.tolist(), [7.0, 5.0, 8.1, -4.1])
+        self.assertEqual(time_series.start, datetime.fromisoformat("2019-01-31"))
         self.assertEqual(len(time_series.resolution), 2)
-        self.assertEqual(time_series.resolution, [relativedelta(days=1), relativedelta(months=1)])
+        self.assertEqual(time_series.resolution, [ONE_DAY, ONE_MONTH])
         self.assertFalse(time_series.ignore_year)
         self.assertFalse(time_series.repeat)
 
+    def test_TimeSeriesFixedResolution_indexes_with_single_month_resolution(self):
+        time_series = TimeSeriesFixedResolution("2019-01-31", "1M", [7.0, 5.0, 8.1], False, False)
+        self.assertEqual(
+            time_series.indexes,
+            numpy.array(["2019-01-31", "2019-02-28", "2019-03-31"], dtype="datetime64[s]"),
+        )
+
+    def test_TimeSeriesFixedResolution_indexes_follow_resolution_changes(self):
+        time_series = TimeSeriesFixedResolution("2019-01-31", "1D", [7.0, 5.0], False, False)
+        self.assertEqual(time_series.indexes, numpy.array(["2019-01-31", "2019-02-01"], dtype="datetime64[s]"))
+        time_series.resolution = "1M"
+        self.assertEqual(time_series.indexes, numpy.array(["2019-01-31", "2019-02-28"], dtype="datetime64[s]"))
+        time_series.resolution = "6h"
+        self.assertEqual(
+            time_series.indexes, numpy.array(["2019-01-31T00:00", "2019-01-31T06:00"], dtype="datetime64[s]")
+        )
+
     def test_from_database_TimeSeriesFixedResolution_default_resolution_is_1hour(self):
         database_value = b"""{
                                    "index": {
@@ -478,7 +489,7 @@ class TestParameterValue(unittest.TestCase):
         time_series = from_database(database_value, value_type="time_series")
         self.assertEqual(len(time_series), 3)
         self.assertEqual(len(time_series.resolution), 1)
-        self.assertEqual(time_series.resolution[0], relativedelta(hours=1))
+        self.assertEqual(time_series.resolution[0], ONE_HOUR)
 
     def test_from_database_TimeSeriesFixedResolution_default_resolution_unit_is_minutes(self):
         database_value = b"""{
@@ -491,7 +502,7 @@ class TestParameterValue(unittest.TestCase):
         time_series = from_database(database_value, value_type="time_series")
         self.assertEqual(len(time_series), 3)
         self.assertEqual(len(time_series.resolution), 1)
-        self.assertEqual(time_series.resolution[0], relativedelta(minutes=30))
+        self.assertEqual(time_series.resolution[0], HALF_AN_HOUR)
         database_value = b"""{
                                    "index": {
                                        "start": "2019-03-23",
@@ -502,7 +513,7 @@ class TestParameterValue(unittest.TestCase):
         time_series = from_database(database_value, value_type="time_series")
         self.assertEqual(len(time_series), 3)
         self.assertEqual(len(time_series.resolution), 2)
-        self.assertEqual(time_series.resolution[0], relativedelta(minutes=30))
+        self.assertEqual(time_series.resolution[0], HALF_AN_HOUR)
         self.assertEqual(time_series.resolution[1], relativedelta(minutes=45))
 
     def test_from_database_TimeSeriesFixedResolution_default_ignore_year(self):
@@ -531,10 +542,10 @@ class TestParameterValue(unittest.TestCase):
     def test_TimeSeriesFixedResolution_to_database(self):
         values = numpy.array([3, 2, 4], dtype=float)
         resolution = [duration_to_relativedelta("1 months")]
-        start = datetime(year=2007, month=6, day=1)
+        start = datetime(2007, 6, 1)
         value = TimeSeriesFixedResolution(start, resolution, values, True, True)
         db_value, value_type = value.to_database()
-        releases = json.loads(db_value)
+        releases = _loads(db_value)
         self.assertEqual(
             releases,
             {
@@ -544,13 +555,12 @@ class TestParameterValue(unittest.TestCase):
         )
         self.assertEqual(value_type, "time_series")
 
-    def test_TimeSeriesFixedResolution_to_database_with_index_type(self):
+    def test_TimeSeriesFixedResolution_to_dict_with_index_type(self):
         values = numpy.array([3, 2, 4], dtype=float)
         resolution = [duration_to_relativedelta("1 months")]
-        start = datetime(year=2007, month=6, day=1)
+        start = datetime(2007, 6, 1)
         value = TimeSeriesFixedResolution(start, resolution, values, True, True, "index")
-        db_value, value_type = value.to_database()
-        releases = json.loads(db_value)
+        releases = value.to_dict()
         self.assertEqual(
             releases,
             {
@@ -559,16 +569,34 @@ class TestParameterValue(unittest.TestCase):
                 "data": [3, 2, 4],
             },
         )
-        self.assertEqual(value_type, "time_series")
+        self.assertEqual(value.type_(), "time_series")
+
+    def test_TimeSeriesFixedResolution_with_datetime64_start_to_database(self):
+        value = TimeSeriesFixedResolution(numpy.datetime64("2007-06-01"), "1h", [3.0, 2.0], False, False)
+        self.assertEqual(value.start, date(2007, 6, 1))
+        db_value, _ = value.to_database()
+        self.assertEqual(_loads(db_value)["index"]["start"], "2007-06-01")
+
+    def test_TimeSeriesFixedResolution_with_nanosecond_datetime64_start_to_database(self):
+        start = numpy.datetime64("2007-06-01T00:00:00.000000000")
+        value = TimeSeriesFixedResolution(start, "1h", [3.0, 2.0], False, False)
+        self.assertEqual(value.start, datetime(2007, 6, 1))
+        db_value, _ = value.to_database()
+        self.assertEqual(_loads(db_value)["index"]["start"], "2007-06-01 00:00:00")
+
+    def test_TimeSeriesFixedResolution_with_date_start_to_database(self):
+        value = TimeSeriesFixedResolution(date(2019, 1, 1), "1D", [3.0, 2.0], False, False)
+        db_value, _ = value.to_database()
+        self.assertEqual(_loads(db_value)["index"]["start"], "2019-01-01")
 
     def test_TimeSeriesFixedResolution_resolution_list_to_database(self):
-        start = datetime(year=2007, month=1, day=1)
+        start = datetime(2007, 1, 1)
         resolutions = ["1 month", "1 year"]
         resolutions = [duration_to_relativedelta(r) for r in resolutions]
         values = numpy.array([3.0, 2.0, 4.0])
         value = TimeSeriesFixedResolution(start, resolutions, values, True, True)
         db_value, value_type = value.to_database()
-        releases = json.loads(db_value)
+        releases = _loads(db_value)
         self.assertEqual(
             releases,
             {
@@ -595,103 +623,101 @@ class TestParameterValue(unittest.TestCase):
         for element in series.resolution:
             self.assertTrue(isinstance(element, relativedelta))
 
+    def test_TimeSeriesFixedResolution_resolution_setter_does_not_modify_argument(self):
+        resolution = ("1D", "2D")
+        series = TimeSeriesFixedResolution("2019-01-03T00:30:33", resolution, [3.0, 2.0, 1.0], False, False)
+        self.assertEqual(series.resolution, [ONE_DAY, relativedelta(days=2)])
+        resolution = ["1h", "3h"]
+        series.resolution = resolution
+        self.assertEqual(series.resolution, [ONE_HOUR, relativedelta(hours=3)])
+        self.assertEqual(resolution, ["1h", "3h"])
+
     def test_TimeSeriesVariableResolution_init_conversion(self):
         series = TimeSeriesVariableResolution(["2008-07-08T03:00", "2008-08-08T13:30"], [3.3, 4.4], True, True)
-        self.assertTrue(isinstance(series.indexes, np.ndarray))
+        self.assertTrue(isinstance(series.indexes, numpy.ndarray))
         for index in series.indexes:
-            self.assertTrue(isinstance(index, np.datetime64))
-        self.assertTrue(isinstance(series.values, np.ndarray))
+            self.assertTrue(isinstance(index, numpy.datetime64))
+        self.assertTrue(isinstance(series.values, numpy.ndarray))
+
+    def test_TimeSeriesVariableResolution_init_with_invalid_stamp_raises(self):
+        with self.assertRaises(ParameterValueFormatError):
+            TimeSeriesVariableResolution(["2008-07-08T03:00", "not a date"], [3.3, 4.4], True, True)
+
+    def test_TimeSeriesVariableResolution_does_not_copy_float_values(self):
+        values = numpy.array([3.3, 4.4])
+        series = TimeSeriesVariableResolution(["2008-07-08T03:00", "2008-08-08T13:30"], values, True, True)
+        self.assertIs(series.values, values)
 
     def test_from_database_Map_with_index_name(self):
         database_value = b'{"index_type":"str", "index_name": "index", "data":[["a", 1.1]]}'
         value = from_database(database_value, value_type="map")
         self.assertIsInstance(value, Map)
         self.assertEqual(value.indexes, ["a"])
-        self.assertEqual(value.values, [1.1])
+        self.assertListEqual(value.values, [1.1])
         self.assertEqual(value.index_name, "index")
 
-    def test_from_database_Map_dictionary_format(self):
-        database_value = b'{"index_type":"str", "data":{"a": 1.1, "b": 2.2}}'
-        value = from_database(database_value, value_type="map")
+    def test_from_dict_Map_dictionary_format(self):
+        value = from_dict({"type": "map", "index_type": "str", "data": {"a": 1.1, "b": 2.2}})
         self.assertIsInstance(value, Map)
         self.assertEqual(value.indexes, ["a", "b"])
-        self.assertEqual(value.values, [1.1, 2.2])
+        self.assertListEqual(value.values, [1.1, 2.2])
         self.assertEqual(value.index_name, "x")
 
-    def test_from_database_Map_two_column_array_format(self):
-        database_value = b'{"index_type":"float", "data":[[1.1, "a"], [2.2, "b"]]}'
-        value = from_database(database_value, value_type="map")
+    def test_from_dict_Map_two_column_array_format(self):
+        value = from_dict({"type": "map", "index_type": "float", "data": [[1.1, "a"], [2.2, "b"]]})
         self.assertIsInstance(value, Map)
         self.assertEqual(value.indexes, [1.1, 2.2])
-        self.assertEqual(value.values, ["a", "b"])
+        self.assertListEqual(value.values, ["a", "b"])
         self.assertEqual(value.index_name, "x")
 
-    def test_from_database_Map_nested_maps(self):
-        database_value = b'''
-        {
-             "index_type": "duration",
-              "data":[["1 hour", {"type": "map",
-                                  "index_type": "date_time",
-                                  "data": {"2020-01-01T12:00": {"type":"duration", "data":"3 hours"}}}]]
-        }'''
-        value = from_database(database_value, value_type="map")
+    def test_from_dict_Map_nested_maps(self):
+        nested_map = {
+            "type": "map",
+            "index_type": "date_time",
+            "data": {"2020-01-01T12:00": {"type": "duration", "data": "3 hours"}},
+        }
+        value = from_dict({"type": "map", "index_type": "duration", "data": [["1 hour", nested_map]]})
         self.assertEqual(value.indexes, [Duration("1 hour")])
         nested_map = value.values[0]
         self.assertIsInstance(nested_map, Map)
         self.assertEqual(nested_map.indexes, [DateTime("2020-01-01T12:00")])
-        self.assertEqual(nested_map.values, [Duration("3 hours")])
+        self.assertListEqual(nested_map.values, [Duration("3 hours")])
 
-    def test_from_database_Map_with_TimeSeries_values(self):
-        database_value = b'''
-        {
-             "index_type": "duration",
-              "data":[["1 hour", {"type": "time_series",
-                                  "data": [["2020-01-01T12:00", -3.0], ["2020-01-02T12:00", -9.3]]
-                                 }
-                     ]]
-        }'''
-        value = from_database(database_value, value_type="map")
+    def test_from_dict_Map_with_TimeSeries_values(self):
+        time_series = {"type": "time_series", "data": [["2020-01-01T12:00", -3.0], ["2020-01-02T12:00", -9.3]]}
+        value = from_dict({"type": "map", "index_type": "duration", "data": [["1 hour", time_series]]})
         self.assertEqual(value.indexes, [Duration("1 hour")])
         self.assertEqual(
             value.values,
             [TimeSeriesVariableResolution(["2020-01-01T12:00", "2020-01-02T12:00"], [-3.0, -9.3], False, False)],
         )
 
-    def test_from_database_Map_with_Array_values(self):
-        database_value = b'''
-        {
-             "index_type": "duration",
-              "data":[["1 hour", {"type": "array", "data": [-3.0, -9.3]}]]
-        }'''
-        value = from_database(database_value, value_type="map")
+    def test_from_dict_Map_with_Array_values(self):
+        array = {"type": "array", "data": [-3.0, -9.3]}
+        value = from_dict({"type": "map", "index_type": "duration", "data": [["1 hour", array]]})
         self.assertEqual(value.indexes, [Duration("1 hour")])
-        self.assertEqual(value.values, [Array([-3.0, -9.3])])
+        self.assertListEqual(value.values, [Array([-3.0, -9.3])])
 
-    def test_from_database_Map_with_TimePattern_values(self):
-        database_value = b'''
-        {
-             "index_type": "float",
-              "data":[["2.3", {"type": "time_pattern", "data": {"M1-2": -9.3, "M3-12": -3.9}}]]
-        }'''
-        value = from_database(database_value, value_type="map")
+    def test_from_dict_Map_with_TimePattern_values(self):
+        time_pattern = {"type": "time_pattern", "data": {"M1-2": -9.3, "M3-12": -3.9}}
+        value = from_dict({"type": "map", "index_type": "float", "data": [["2.3", time_pattern]]})
         self.assertEqual(value.indexes, [2.3])
-        self.assertEqual(value.values, [TimePattern(["M1-2", "M3-12"], [-9.3, -3.9])])
+        self.assertListEqual(value.values, [TimePattern(["M1-2", "M3-12"], [-9.3, -3.9])])
 
     def test_Map_to_database(self):
         map_value = Map(["a", "b"], [1.1, 2.2])
         db_value, value_type = to_database(map_value)
-        raw = json.loads(db_value)
-        self.assertEqual(raw, {"index_type": "str", "data": [["a", 1.1], ["b", 2.2]]})
+        raw = _loads(db_value)
+        self.assertDictEqual(raw, {"index_type": "str", "data": [["a", 1.1], ["b", 2.2]]})
         self.assertEqual(value_type, "map")
 
-    def test_Map_to_database_with_index_names(self):
+    def test_Map_to_dict_with_index_names(self):
         nested_map = Map(["a"], [0.3])
         nested_map.index_name = "nested index"
         map_value = Map(["A"], [nested_map])
         map_value.index_name = "index"
-        db_value, value_type = to_database(map_value)
-        raw = json.loads(db_value)
-        self.assertEqual(
+        raw = map_value.to_dict()
+        self.assertDictEqual(
             raw,
             {
                 "index_type": "str",
@@ -701,16 +727,15 @@ class TestParameterValue(unittest.TestCase):
                 ],
             },
         )
-        self.assertEqual(value_type, "map")
+        self.assertEqual(map_value.type_(), "map")
 
-    def test_Map_to_database_with_TimeSeries_values(self):
+    def test_Map_to_dict_with_TimeSeries_values(self):
         time_series1 = TimeSeriesVariableResolution(["2020-01-01T12:00", "2020-01-02T12:00"], [2.3, 4.5], False, False)
         time_series2 = TimeSeriesVariableResolution(
             ["2020-01-01T12:00", "2020-01-02T12:00"], [-4.5, -2.3], False, False
         )
         map_value = Map(["a", "b"], [time_series1, time_series2])
-        db_value, value_type = to_database(map_value)
-        raw = json.loads(db_value)
+        raw = map_value.to_dict()
         expected = {
             "index_type": "str",
             "data": [
@@ -718,15 +743,14 @@ class TestParameterValue(unittest.TestCase):
                 ["b", {"type": "time_series", "data": {"2020-01-01T12:00:00": -4.5, "2020-01-02T12:00:00": -2.3}}],
             ],
         }
-        self.assertEqual(raw, expected)
-        self.assertEqual(value_type, "map")
+        self.assertDictEqual(raw, expected)
+        self.assertEqual(map_value.type_(), "map")
 
-    def test_Map_to_database_nested_maps(self):
+    def test_Map_to_dict_nested_maps(self):
         nested_map = Map([Duration("2 months")], [Duration("5 days")])
         map_value = Map([DateTime("2020-01-01T13:00")], [nested_map])
-        db_value, value_type = to_database(map_value)
-        raw = json.loads(db_value)
-        self.assertEqual(
+        raw = map_value.to_dict()
+        self.assertDictEqual(
             raw,
             {
                 "index_type": "date_time",
@@ -738,33 +762,33 @@ class TestParameterValue(unittest.TestCase):
                 ],
             },
         )
-        self.assertEqual(value_type, "map")
+        self.assertEqual(map_value.type_(), "map")
 
     def test_Array_of_floats_to_database(self):
         array = Array([-1.1, -2.2, -3.3])
         db_value, value_type = to_database(array)
-        raw = json.loads(db_value)
+        raw = _loads(db_value)
         self.assertEqual(raw, {"value_type": "float", "data": [-1.1, -2.2, -3.3]})
         self.assertEqual(value_type, "array")
 
     def test_Array_of_strings_to_database(self):
         array = Array(["a", "b"])
         db_value, value_type = to_database(array)
-        raw = json.loads(db_value)
+        raw = _loads(db_value)
         self.assertEqual(raw, {"value_type": "str", "data": ["a", "b"]})
         self.assertEqual(value_type, "array")
 
     def test_Array_of_DateTimes_to_database(self):
         array = Array([DateTime("2020-01-01T13:00")])
         db_value, value_type = to_database(array)
-        raw = json.loads(db_value)
+        raw = _loads(db_value)
         self.assertEqual(raw, {"value_type": "date_time", "data": ["2020-01-01T13:00:00"]})
         self.assertEqual(value_type, "array")
 
     def test_Array_of_Durations_to_database(self):
         array = Array([Duration("4 months")])
         db_value, value_type = to_database(array)
-        raw = json.loads(db_value)
+        raw = _loads(db_value)
         self.assertEqual(raw, {"value_type": "duration", "data": ["4M"]})
         self.assertEqual(value_type, "array")
 
@@ -778,52 +802,32 @@ class TestParameterValue(unittest.TestCase):
         self.assertEqual(array.indexes, [0, 1])
         self.assertEqual(array.index_name, "i")
 
-    def test_Array_of_default_value_type_from_database(self):
-        database_value = b"""{
-            "data": [1.2, 2.3]
-        }"""
-        array = from_database(database_value, value_type="array")
+    def test_Array_of_default_value_type_from_dict(self):
+        array = from_dict({"type": "array", "data": [1.2, 2.3]})
         self.assertEqual(array.values, [1.2, 2.3])
         self.assertEqual(array.indexes, [0, 1])
         self.assertEqual(array.index_name, "i")
 
-    def test_Array_of_strings_from_database(self):
-        database_value = b"""{
-            "value_type": "str",
-            "data": ["A", "B"]
-        }"""
-        array = from_database(database_value, value_type="array")
+    def test_Array_of_strings_from_dict(self):
+        array = from_dict({"type": "array", "value_type": "str", "data": ["A", "B"]})
         self.assertEqual(array.values, ["A", "B"])
         self.assertEqual(array.indexes, [0, 1])
         self.assertEqual(array.index_name, "i")
 
-    def test_Array_of_DateTimes_from_database(self):
-        database_value = b"""{
-            "value_type": "date_time",
-            "data": ["2020-03-25T10:34:00"]
-        }"""
-        array = from_database(database_value, value_type="array")
+    def test_Array_of_DateTimes_from_dict(self):
+        array = from_dict({"type": "array", "value_type": "date_time", "data": ["2020-03-25T10:34:00"]})
         self.assertEqual(array.values, [DateTime("2020-03-25T10:34:00")])
         self.assertEqual(array.indexes, [0])
         self.assertEqual(array.index_name, "i")
 
-    def test_Array_of_Durations_from_database(self):
-        database_value = b"""{
-            "value_type": "duration",
-            "data": ["2 years", "7 seconds"]
-        }"""
-        array = from_database(database_value, value_type="array")
+    def test_Array_of_Durations_from_dict(self):
+        array = from_dict({"type": "array", "value_type": "duration", "data": ["2 years", "7 seconds"]})
         self.assertEqual(array.values, [Duration("2 years"), Duration("7s")])
         self.assertEqual(array.indexes, [0, 1])
         self.assertEqual(array.index_name, "i")
 
-    def test_Array_from_database_with_index_name(self):
-        database_value = b"""{
-            "value_type": "float",
-            "index_name": "index",
-            "data": [1.2]
-        }"""
-        array = from_database(database_value, value_type="array")
+    def test_Array_from_dict_with_index_name(self):
+        array = from_dict({"type": "array", "value_type": "float", "index_name": "index", "data": [1.2]})
         self.assertEqual(array.values, [1.2])
         self.assertEqual(array.indexes, [0])
         self.assertEqual(array.index_name, "index")
@@ -838,17 +842,25 @@ class TestParameterValue(unittest.TestCase):
         copied = DateTime(date_time)
         self.assertEqual(copied, date_time)
 
+    def test_DateTime_construction_from_string_with_utc_designator(self):
+        date_time = DateTime("2019-07-03T09:09:09Z")
+        self.assertEqual(date_time.value, datetime(2019, 7, 3, 9, 9, 9, tzinfo=timezone.utc))
+
+    def test_DateTime_construction_from_non_iso_string(self):
+        date_time = DateTime("3 July 2019 09:09:09")
+        self.assertEqual(date_time.value, datetime(2019, 7, 3, 9, 9, 9))
+
     def test_Duration_copy_construction(self):
         duration = Duration("3 minutes")
         copied = Duration(duration)
         self.assertEqual(copied, duration)
 
     def test_DateTime_equality(self):
-        date_time = DateTime(dateutil.parser.parse("2019-07-03T09:09:09"))
+        date_time = DateTime(datetime.fromisoformat("2019-07-03T09:09:09"))
         self.assertEqual(date_time, date_time)
-        equal_date_time = DateTime(dateutil.parser.parse("2019-07-03T09:09:09"))
+        equal_date_time = DateTime(datetime.fromisoformat("2019-07-03T09:09:09"))
         self.assertEqual(date_time, equal_date_time)
-        inequal_date_time = DateTime(dateutil.parser.parse("2018-07-03T09:09:09"))
+        inequal_date_time = DateTime(datetime.fromisoformat("2018-07-03T09:09:09"))
         self.assertNotEqual(date_time, inequal_date_time)
 
     def test_Duration_equality(self):
@@ -867,11 +879,11 @@ class TestParameterValue(unittest.TestCase):
         self.assertEqual(map_value, Map(["A"], [Map(["a"], [-2.3])]))
 
     def test_TimePattern_equality(self):
-        pattern = TimePattern(["D1-2", "D3-7"], np.array([-2.3, -5.0]))
+        pattern = TimePattern(["D1-2", "D3-7"], numpy.array([-2.3, -5.0]))
         self.assertEqual(pattern, pattern)
-        equal_pattern = TimePattern(["D1-2", "D3-7"], np.array([-2.3, -5.0]))
+        equal_pattern = TimePattern(["D1-2", "D3-7"], numpy.array([-2.3, -5.0]))
         self.assertEqual(pattern, equal_pattern)
-        inequal_pattern = TimePattern(["M1-3", "M4-12"], np.array([-5.0, 23.0]))
+        inequal_pattern = TimePattern(["M1-3", "M4-12"], numpy.array([-5.0, 23.0]))
         self.assertNotEqual(pattern, inequal_pattern)
 
     def test_TimeSeriesFixedResolution_equality(self):
@@ -879,7 +891,8 @@ class TestParameterValue(unittest.TestCase):
         self.assertEqual(series, series)
         equal_series = TimeSeriesFixedResolution("2019-01-03T00:30:33", "1D", [3.0, 2.0, 1.0], False, False)
         self.assertEqual(series, equal_series)
-        inequal_series = TimeSeriesFixedResolution("2019-01-03T00:30:33", "1D", [3.0, 2.0, 1.0], True, False)
+        inequal_series = copy.copy(series)
+        inequal_series.ignore_year = True
         self.assertNotEqual(series, inequal_series)
 
     def test_TimeSeriesVariableResolution_equality(self):
@@ -887,16 +900,35 @@ class TestParameterValue(unittest.TestCase):
         self.assertEqual(series, series)
         equal_series = TimeSeriesVariableResolution(["2000-01-01T00:00", "2001-01-01T00:00"], [4.2, 2.4], True, True)
         self.assertEqual(series, equal_series)
-        inequal_series = TimeSeriesVariableResolution(["2000-01-01T00:00", "2002-01-01T00:00"], [4.2, 2.4], False, True)
+        inequal_series = copy.copy(series)
+        inequal_series.ignore_year = False
+        self.assertNotEqual(series, inequal_series)
+        inequal_series = TimeSeriesVariableResolution(["2000-01-01T00:00", "2002-01-01T00:00"], [4.2, 2.4], True, True)
         self.assertNotEqual(series, inequal_series)
 
+    def test_value_classes_have_no_instance_dicts_but_support_weak_references(self):
+        values = (
+            DateTime("2019-07-03T09:09:09"),
+            Duration("3 minutes"),
+            ListValueRef(23),
+            Array([2.3]),
+            Map(["a"], [2.3]),
+            TimePattern(["M1-12"], [2.3]),
+            TimeSeriesFixedResolution("2019-01-03T00:30:33", "1D", [2.3], False, False),
+            TimeSeriesVariableResolution(["2019-01-03T00:30:33"], [2.3], False, False),
+        )
+        for value in values:
+            with self.subTest(value_type=type(value).__name__):
+                self.assertFalse(hasattr(value, "__dict__"))
+                self.assertIs(weakref.ref(value)(), value)
+
     def test_IndexedValue_constructor_converts_values_to_floats(self):
         value = IndexedNumberArray("", [4, -9, 11])
-        self.assertEqual(value.values.dtype, np.dtype(float))
-        numpy.testing.assert_equal(value.values, numpy.array([4.0, -9.0, 11.0]))
+        self.assertEqual(value.values.dtype, numpy.dtype(float))
+        self.assertEqual(value.values.tolist(), [4.0, -9.0, 11.0])
         value = IndexedNumberArray("", numpy.array([16, -251, 99]))
-        self.assertEqual(value.values.dtype, np.dtype(float))
-        numpy.testing.assert_equal(value.values, numpy.array([16.0, -251.0, 99.0]))
+        self.assertEqual(value.values.dtype, numpy.dtype(float))
+        self.assertEqual(value.values.tolist(), [16.0, -251.0, 99.0])
 
     def test_Map_is_nested(self):
         map_value = Map(["a"], [-2.3])
@@ -978,6 +1010,13 @@ class TestParameterValue(unittest.TestCase):
             ),
         )
 
+    def test_convert_containers_to_maps_time_pattern_gives_native_floats(self):
+        time_pattern = TimePattern(["M1-4", "M5-12"], [2.5, 2.3])
+        map_ = convert_containers_to_maps(time_pattern)
+        self.assertEqual(map_, Map(["M1-4", "M5-12"], [2.5, 2.3], index_name=TimePattern.DEFAULT_INDEX_NAME))
+        for x in map_.values:
+            self.assertIs(type(x), float)
+
     def test_convert_containers_to_maps_map_with_time_series(self):
         time_series = TimeSeriesVariableResolution(["2020-11-27T12:55", "2020-11-27T13:00"], [2.5, 2.3], False, False)
         map_ = Map(["a", "b"], [-1.1, time_series])